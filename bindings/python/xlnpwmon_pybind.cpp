@@ -1,6 +1,9 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
+#include <climits>
+#include <cmath>
+#include <cstring>
 #include "xlnpwmon/xlnpwmon.h"
 
 namespace py = pybind11;
@@ -18,6 +21,23 @@ void add_stats_to_dict(py::dict& d, const pm_stats_t& s) {
     d["count"] = s.count;
 }
 
+/**
+ * @brief Register NumPy structured dtypes matching the C data and statistics structures
+ *
+ * Registration imports NumPy, so it is done on first use rather than at module
+ * import to keep NumPy an optional dependency.
+ */
+void register_numpy_dtypes() {
+    static bool registered = false;
+    if (!registered) {
+        PYBIND11_NUMPY_DTYPE(pm_sensor_data_t, name, type, voltage, current, power,
+                             online, status, warning_threshold, critical_threshold);
+        PYBIND11_NUMPY_DTYPE(pm_stats_t, min, max, avg, total, count);
+        PYBIND11_NUMPY_DTYPE(pm_sensor_stats_t, name, voltage, current, power);
+        registered = true;
+    }
+}
+
 /**
  * @brief Wrapper class to handle C structures and provide Python interface
  */
@@ -101,6 +121,43 @@ public:
         return sampling;
     }
 
+    /**
+     * @brief Wait until enough samples have been collected
+     * @param count Number of samples (since the last reset) to wait for
+     * @param timeout Maximum time to wait in seconds (inf to wait until
+     *                reached or sampling stops)
+     * @return True if the samples are available, false on timeout
+     * @throws std::invalid_argument if timeout is negative or NaN
+     * @throws std::runtime_error if sampling is not running
+     */
+    bool wait_for_samples(uint64_t count, double timeout) {
+        if (std::isnan(timeout) || timeout < 0) {
+            throw std::invalid_argument("timeout must be a non-negative number");
+        }
+
+        // 超出 int 毫秒范围时截断，inf 表示一直等待
+        int timeout_ms;
+        if (std::isinf(timeout)) {
+            timeout_ms = -1;
+        } else if (timeout * 1000 >= static_cast<double>(INT_MAX)) {
+            timeout_ms = INT_MAX;
+        } else {
+            timeout_ms = static_cast<int>(timeout * 1000);
+        }
+
+        bool reached = false;
+        pm_error_t error;
+        {
+            // 释放 GIL，避免阻塞其他 Python 线程
+            py::gil_scoped_release release;
+            error = pm_wait_for_samples(handle_, count, timeout_ms, &reached);
+        }
+        if (error != PM_SUCCESS) {
+            throw std::runtime_error("Failed to wait for samples");
+        }
+        return reached;
+    }
+
     /**
      * @brief Get the latest power data
      * @return Python dictionary containing the latest power data
@@ -147,6 +204,31 @@ public:
         return result;
     }
 
+    /**
+     * @brief Get the latest power data as a NumPy structured array
+     * @return NumPy array with one pm_sensor_data_t record per sensor, with
+     *         fields name, type, voltage, current, power, online, status,
+     *         warning_threshold and critical_threshold
+     * @throws std::runtime_error if getting data fails
+     *
+     * The records are copied in one block under the library's data lock, so
+     * they all come from the same sampling iteration and per-field reductions
+     * such as data['power'].sum() run in NumPy.
+     */
+    py::array_t<pm_sensor_data_t> get_latest_data_array() {
+        register_numpy_dtypes();
+        int count = get_sensor_count();
+        py::array_t<pm_sensor_data_t> result(count);
+        if (pm_copy_latest_data(handle_, result.mutable_data(), &count) != PM_SUCCESS) {
+            throw std::runtime_error("Failed to get latest data");
+        }
+        if (count != result.size()) {
+            result.resize({static_cast<py::ssize_t>(count)});
+        }
+
+        return result;
+    }
+
     /**
      * @brief Get power statistics
      * @return Python dictionary containing power statistics
@@ -201,6 +283,31 @@ public:
         return result;
     }
 
+    /**
+     * @brief Get per-sensor power statistics as a NumPy structured array
+     * @return NumPy array with one pm_sensor_stats_t record per sensor, with
+     *         fields name, voltage, current and power (each having min, max,
+     *         avg, total and count)
+     * @throws std::runtime_error if getting statistics fails
+     *
+     * The records are copied in one block under the library's data lock,
+     * so no Python objects are created per field and the result is a
+     * consistent snapshot that is not affected by later samples.
+     */
+    py::array_t<pm_sensor_stats_t> get_statistics_array() {
+        register_numpy_dtypes();
+        int count = get_sensor_count();
+        py::array_t<pm_sensor_stats_t> result(count);
+        if (pm_copy_statistics(handle_, result.mutable_data(), &count) != PM_SUCCESS) {
+            throw std::runtime_error("Failed to get statistics");
+        }
+        if (count != result.size()) {
+            result.resize({static_cast<py::ssize_t>(count)});
+        }
+
+        return result;
+    }
+
     /**
      * @brief Reset power statistics
      * @throws std::runtime_error if resetting statistics fails
@@ -315,8 +422,12 @@ PYBIND11_MODULE(_core, m) {
         .def("start_sampling", &PowerMonitor::start_sampling)
         .def("stop_sampling", &PowerMonitor::stop_sampling)
         .def("is_sampling", &PowerMonitor::is_sampling)
+        .def("wait_for_samples", &PowerMonitor::wait_for_samples,
+             py::arg("count"), py::arg("timeout") = 1.0)
         .def("get_latest_data", &PowerMonitor::get_latest_data)
+        .def("get_latest_data_array", &PowerMonitor::get_latest_data_array)
         .def("get_statistics", &PowerMonitor::get_statistics)
+        .def("get_statistics_array", &PowerMonitor::get_statistics_array)
         .def("reset_statistics", &PowerMonitor::reset_statistics)
         .def("get_power_summary", &PowerMonitor::get_power_summary)
         .def("get_power_summary_stats", &PowerMonitor::get_power_summary_stats)
@@ -2,22 +2,33 @@
 # -*- coding: utf-8 -*-
 
 import xlnpwmon
-import time
 import numpy as np
+from operator import itemgetter
 
-def cpu_intensive_task():
+# Pull every statistic field out of a stats dict in one call
+_stats_get = itemgetter('min', 'max', 'avg', 'total', 'count')
+
+def create_matrices(size=4096):
+    """Create the input matrices for the CPU-intensive task"""
+    # PCG64 generates float32 natively, which is much faster than the legacy
+    # np.random.rand and avoids a float64 -> float32 downcast copy
+    rng = np.random.default_rng(0)
+    matrix1 = rng.standard_normal((size, size), dtype=np.float32)
+    matrix2 = rng.standard_normal((size, size), dtype=np.float32)
+    return matrix1, matrix2
+
+def cpu_intensive_task(matrix1, matrix2, iterations=4):
     """Simulate a CPU-intensive task"""
     print("Starting CPU-intensive task...")
-    # Create a large matrix and perform matrix operations
-    size = 10000
-    matrix1 = np.random.rand(size, size)
-    matrix2 = np.random.rand(size, size)
-    
-    # Perform matrix multiplication
-    result = np.dot(matrix1, matrix2)
+    # float32 sgemm packs twice as many values per SIMD register as float64
+    # dgemm on AVX2/AVX-512, and a 4096x4096 working set keeps the load
+    # compute-bound instead of thrashing DRAM.
+    # Perform matrix multiplication (dispatches to sgemm in the linked BLAS)
+    for _ in range(iterations):
+        result = np.matmul(matrix1, matrix2)
     print("CPU-intensive task completed")
 
-def monitor_power_consumption(task_func):
+def monitor_power_consumption(task_func, *args):
     """Monitor power consumption during task execution"""
     # Create a power monitor instance
     monitor = xlnpwmon.PowerMonitor()
@@ -33,44 +44,53 @@ def monitor_power_consumption(task_func):
     monitor.start_sampling()
     
     # Execute the task
-    task_func()
+    task_func(*args)
     
-    # Wait for a short period to ensure data collection is complete
-    time.sleep(0.5)
+    # Make sure at least a few samples have been collected
+    monitor.wait_for_samples(5, timeout=1.0)
     
-    # Stop sampling
+    # Stop sampling and grab statistics before doing any formatting work
     monitor.stop_sampling()
-    
-    # Get statistics
     stats = monitor.get_statistics()
+    del monitor
     
     # Print total power consumption statistics
-    total_stats = stats['total']
-    print("\nPower Consumption Statistics:")
-    print(f"Total Power Consumption:")
-    print(f"  Minimum Value: {total_stats['power']['min']:.2f} W")
-    print(f"  Maximum Value: {total_stats['power']['max']:.2f} W")
-    print(f"  Average Value: {total_stats['power']['avg']:.2f} W")
-    print(f"  Total Energy Consumption: {total_stats['power']['total']:.2f} J")
-    print(f"  Sample Count: {total_stats['power']['count']}")
+    mn, mx, av, tot, cnt = _stats_get(stats['total']['power'])
+    sensors = stats['sensors']
+    lines = [
+        "\nPower Consumption Statistics:",
+        "Total Power Consumption:",
+        f"  Minimum Value: {mn:.2f} W\n"
+        f"  Maximum Value: {mx:.2f} W\n"
+        f"  Average Value: {av:.2f} W\n"
+        f"  Total Energy Consumption: {tot:.2f} J\n"
+        f"  Sample Count: {cnt}",
+        "\nPower Consumption Information for Each Sensor:",
+    ]
     
     # Print power consumption information for each sensor
-    print("\nPower Consumption Information for Each Sensor:")
-    for sensor in stats['sensors']:
-        print(f"\nSensor: {sensor['name']}")
-        print(f"  Minimum Value: {sensor['power']['min']:.2f} W")
-        print(f"  Maximum Value: {sensor['power']['max']:.2f} W")
-        print(f"  Average Value: {sensor['power']['avg']:.2f} W")
-        print(f"  Total Energy Consumption: {sensor['power']['total']:.2f} J")
-        print(f"  Sample Count: {sensor['power']['count']}")
+    for sensor in sensors:
+        mn, mx, av, tot, cnt = _stats_get(sensor['power'])
+        lines.append(
+            f"\nSensor: {sensor['name']}\n"
+            f"  Minimum Value: {mn:.2f} W\n"
+            f"  Maximum Value: {mx:.2f} W\n"
+            f"  Average Value: {av:.2f} W\n"
+            f"  Total Energy Consumption: {tot:.2f} J\n"
+            f"  Sample Count: {cnt}"
+        )
+    print("\n".join(lines))
 
 def main():
     """Main function"""
     print("Xilinx Power Monitor Example Program")
     print("=============================")
     
+    # Prepare the inputs before sampling so only the matmul phase is measured
+    matrix1, matrix2 = create_matrices()
+    
     # Monitor power consumption for CPU-intensive task
-    monitor_power_consumption(cpu_intensive_task)
+    monitor_power_consumption(cpu_intensive_task, matrix1, matrix2)
 
 if __name__ == "__main__":
     main()
@@ -190,6 +190,25 @@ pm_error_t pm_stop_sampling(pm_handle_t handle);
  */
 pm_error_t pm_is_sampling(pm_handle_t handle, bool* is_sampling);
 
+/**
+ * @brief Wait until enough samples have been collected
+ *
+ * This function blocks until the total statistics hold at least @p count
+ * samples (counted since the last pm_reset_statistics()), the timeout
+ * expires, or sampling stops. It wakes up on every completed sampling
+ * iteration instead of polling.
+ *
+ * @param handle Library handle
+ * @param count Number of samples to wait for
+ * @param timeout_ms Maximum time to wait in milliseconds (0 to only check,
+ *                   negative to wait until reached or sampling stops)
+ * @param[out] reached Pointer to store whether @p count samples are available
+ * @return Error code (PM_ERROR_NOT_RUNNING if sampling stopped before
+ *         @p count samples were collected; a timeout is not an error)
+ */
+pm_error_t pm_wait_for_samples(pm_handle_t handle, uint64_t count,
+                               int timeout_ms, bool* reached);
+
 /**
  * @brief Get the latest power data
  *
@@ -206,6 +225,20 @@ pm_error_t pm_is_sampling(pm_handle_t handle, bool* is_sampling);
  */
 pm_error_t pm_get_latest_data(pm_handle_t handle, pm_power_data_t* data);
 
+/**
+ * @brief Copy the latest per-sensor data into a caller-provided array
+ *
+ * Unlike pm_get_latest_data(), the records are copied while the library's
+ * data lock is held, so all of them come from the same sampling iteration.
+ *
+ * @param handle Library handle
+ * @param[out] sensors Array to store the data
+ * @param[inout] count On input: size of the array; On output: number of records copied
+ * @return Error code (PM_ERROR_INIT_FAILED if @p count is negative)
+ */
+pm_error_t pm_copy_latest_data(pm_handle_t handle, pm_sensor_data_t* sensors,
+                               int* count);
+
 /**
  * @brief Get the power statistics
  *
@@ -222,6 +255,21 @@ pm_error_t pm_get_latest_data(pm_handle_t handle, pm_power_data_t* data);
  */
 pm_error_t pm_get_statistics(pm_handle_t handle, pm_power_stats_t* stats);
 
+/**
+ * @brief Copy the per-sensor statistics into a caller-provided array
+ *
+ * Unlike pm_get_statistics(), the records are copied while the library's
+ * data lock is held, so the result is a consistent snapshot that later
+ * samples do not modify.
+ *
+ * @param handle Library handle
+ * @param[out] sensors Array to store the statistics
+ * @param[inout] count On input: size of the array; On output: number of records copied
+ * @return Error code (PM_ERROR_INIT_FAILED if @p count is negative)
+ */
+pm_error_t pm_copy_statistics(pm_handle_t handle, pm_sensor_stats_t* sensors,
+                              int* count);
+
 /**
  * @brief Reset the statistics
  *
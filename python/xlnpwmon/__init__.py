@@ -6,7 +6,7 @@ __version__ = "0.0.3" # Keep version consistent
 
 try:
     # Import symbols from the compiled C++ module named '_core'
-    from ._core import PowerMonitor, ErrorCode, SensorType, error_string
+    from ._core import PowerMonitor as _PowerMonitor, ErrorCode, SensorType, error_string
 
     # Define what gets imported with 'from xlnpwmon import *'
     __all__ = ['PowerMonitor', 'ErrorCode', 'SensorType', 'error_string', '__version__']
@@ -20,4 +20,26 @@ except ImportError as e:
         "Please ensure the package was built and installed correctly."
     ) from e
 
-# Optional: Add any pure Python helper functions or classes here if needed.
\ No newline at end of file
+
+class PowerMonitor(_PowerMonitor):
+    """
+    Power monitor with the sensor count cached on the Python side.
+
+    The set of sensors is fixed once the monitor is initialized, so the
+    count only needs to cross into the C extension once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._n_sensors = None
+
+    def get_sensor_count(self):
+        """Return the number of sensors, querying the core module only once."""
+        if self._n_sensors is None:
+            self._n_sensors = super().get_sensor_count()
+        return self._n_sensors
+
+    def reset_statistics(self):
+        """Reset power statistics and drop the cached sensor count."""
+        super().reset_statistics()
+        self._n_sensors = None
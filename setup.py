@@ -1,6 +1,11 @@
+import os
 from setuptools import setup, find_packages
 import pybind11.setup_helpers as setup_helpers
 
+# 默认针对本机 CPU 优化；构建可分发的 wheel 时请覆盖，例如 XLNPWMON_CFLAGS="-O3" XLNPWMON_LDFLAGS=""
+extra_compile_args = os.environ.get("XLNPWMON_CFLAGS", "-O3 -march=native -flto").split()
+extra_link_args = os.environ.get("XLNPWMON_LDFLAGS", "-flto").split()
+
 ext_modules = [
     setup_helpers.Pybind11Extension(
         "xlnpwmon._core",
@@ -10,6 +15,8 @@ ext_modules = [
         include_dirs=['include'],
         define_macros=[('VERSION_INFO', '0.0.3')],
         libraries=['pthread'],  # 如果需要
+        extra_compile_args=extra_compile_args,
+        extra_link_args=extra_link_args,
     ),
 ]
 
@@ -16,6 +16,7 @@
 #include <stdlib.h>
 #include <string.h>
 #include <sys/stat.h>
+#include <time.h>
 #include <unistd.h>
 
 #define HWMON_PATH "/sys/class/hwmon"
@@ -145,6 +146,7 @@ struct pm_handle_s {
 
   pthread_t sampling_thread;  // Sampling thread
   pthread_mutex_t data_mutex; // Mutex for data access
+  pthread_cond_t sample_cond; // Signaled after each sampling iteration
   bool is_sampling;           // Sampling active flag
   bool stop_sampling;         // Stop request flag
 
@@ -412,12 +414,20 @@ static void *sampling_thread_func(void *arg) {
     // Update total statistics
     update_sensor_stats(&handle->total_stats, &handle->total_data);
 
+    // Wake up threads waiting in pm_wait_for_samples()
+    pthread_cond_broadcast(&handle->sample_cond);
+
     pthread_mutex_unlock(&handle->data_mutex);
 
     // Sleep based on sampling frequency
     usleep(1000000 / handle->sampling_frequency);
   }
 
+  // Let waiters observe that sampling has stopped
+  pthread_mutex_lock(&handle->data_mutex);
+  pthread_cond_broadcast(&handle->sample_cond);
+  pthread_mutex_unlock(&handle->data_mutex);
+
   return NULL;
 }
 
@@ -443,9 +453,27 @@ pm_error_t pm_init(pm_handle_t *handle) {
     return PM_ERROR_INIT_FAILED;
   }
 
+  // Initialize condition variable on the monotonic clock so that wall-clock
+  // steps (NTP, RTC sync) do not shorten or stretch pm_wait_for_samples()
+  pthread_condattr_t cond_attr;
+  if (pthread_condattr_init(&cond_attr) != 0) {
+    pthread_mutex_destroy(&h->data_mutex);
+    free(h);
+    return PM_ERROR_INIT_FAILED;
+  }
+  if (pthread_condattr_setclock(&cond_attr, CLOCK_MONOTONIC) != 0 ||
+      pthread_cond_init(&h->sample_cond, &cond_attr) != 0) {
+    pthread_condattr_destroy(&cond_attr);
+    pthread_mutex_destroy(&h->data_mutex);
+    free(h);
+    return PM_ERROR_INIT_FAILED;
+  }
+  pthread_condattr_destroy(&cond_attr);
+
   // Discover sensors
   h->physical_sensor_count = discover_sensors(h->sensors, MAX_PHYSICAL_SENSORS);
   if (h->physical_sensor_count == 0) {
+    pthread_cond_destroy(&h->sample_cond);
     pthread_mutex_destroy(&h->data_mutex);
     free(h);
     return PM_ERROR_NO_SENSORS;
@@ -516,6 +544,7 @@ pm_error_t pm_cleanup(pm_handle_t handle) {
     pm_stop_sampling(handle);
   }
 
+  pthread_cond_destroy(&handle->sample_cond);
   pthread_mutex_destroy(&handle->data_mutex);
   free(handle);
 
@@ -618,6 +647,55 @@ pm_error_t pm_is_sampling(pm_handle_t handle, bool *is_sampling) {
   return PM_SUCCESS;
 }
 
+/**
+ * @brief Wait until enough samples have been collected
+ */
+pm_error_t pm_wait_for_samples(pm_handle_t handle, uint64_t count,
+                               int timeout_ms, bool *reached) {
+  if (!handle) {
+    return PM_ERROR_NOT_INITIALIZED;
+  }
+
+  if (!reached) {
+    return PM_ERROR_INIT_FAILED;
+  }
+
+  struct timespec deadline;
+  clock_gettime(CLOCK_MONOTONIC, &deadline);
+  if (timeout_ms > 0) {
+    deadline.tv_sec += timeout_ms / 1000;
+    deadline.tv_nsec += (long)(timeout_ms % 1000) * 1000000L;
+    if (deadline.tv_nsec >= 1000000000L) {
+      deadline.tv_sec++;
+      deadline.tv_nsec -= 1000000000L;
+    }
+  }
+
+  pm_error_t result = PM_SUCCESS;
+
+  pthread_mutex_lock(&handle->data_mutex);
+
+  while (handle->total_stats.power.count < count) {
+    if (!handle->is_sampling || handle->stop_sampling) {
+      result = PM_ERROR_NOT_RUNNING;
+      break;
+    }
+    if (timeout_ms < 0) {
+      pthread_cond_wait(&handle->sample_cond, &handle->data_mutex);
+    } else if (pthread_cond_timedwait(&handle->sample_cond,
+                                      &handle->data_mutex,
+                                      &deadline) == ETIMEDOUT) {
+      break;
+    }
+  }
+
+  *reached = handle->total_stats.power.count >= count;
+
+  pthread_mutex_unlock(&handle->data_mutex);
+
+  return *reached ? PM_SUCCESS : result;
+}
+
 /**
  * @brief Get the latest power data
  */
@@ -644,6 +722,32 @@ pm_error_t pm_get_latest_data(pm_handle_t handle, pm_power_data_t *data) {
   return PM_SUCCESS;
 }
 
+/**
+ * @brief Copy the latest per-sensor data into a caller-provided array
+ */
+pm_error_t pm_copy_latest_data(pm_handle_t handle, pm_sensor_data_t *sensors,
+                               int *count) {
+  if (!handle) {
+    return PM_ERROR_NOT_INITIALIZED;
+  }
+
+  if (!sensors || !count || *count < 0) {
+    return PM_ERROR_INIT_FAILED;
+  }
+
+  pthread_mutex_lock(&handle->data_mutex);
+
+  int actual_count =
+      (handle->sensor_count < *count) ? handle->sensor_count : *count;
+  memcpy(sensors, handle->current_data,
+         sizeof(pm_sensor_data_t) * actual_count);
+
+  pthread_mutex_unlock(&handle->data_mutex);
+
+  *count = actual_count;
+  return PM_SUCCESS;
+}
+
 /**
  * @brief Get the power statistics
  */
@@ -670,6 +774,31 @@ pm_error_t pm_get_statistics(pm_handle_t handle, pm_power_stats_t *stats) {
   return PM_SUCCESS;
 }
 
+/**
+ * @brief Copy the per-sensor statistics into a caller-provided array
+ */
+pm_error_t pm_copy_statistics(pm_handle_t handle, pm_sensor_stats_t *sensors,
+                              int *count) {
+  if (!handle) {
+    return PM_ERROR_NOT_INITIALIZED;
+  }
+
+  if (!sensors || !count || *count < 0) {
+    return PM_ERROR_INIT_FAILED;
+  }
+
+  pthread_mutex_lock(&handle->data_mutex);
+
+  int actual_count =
+      (handle->sensor_count < *count) ? handle->sensor_count : *count;
+  memcpy(sensors, handle->stats, sizeof(pm_sensor_stats_t) * actual_count);
+
+  pthread_mutex_unlock(&handle->data_mutex);
+
+  *count = actual_count;
+  return PM_SUCCESS;
+}
+
 /**
  * @brief Reset the statistics
  */
@@ -3,18 +3,37 @@
 
 import unittest
 import xlnpwmon
+import threading
 import time
 import warnings
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STAT_KEYS = frozenset(('min', 'max', 'avg', 'total', 'count'))
 
 class TestJetPwMon(unittest.TestCase):
-    def setUp(self):
-        """Setup before each test case"""
-        self.monitor = xlnpwmon.PowerMonitor()
+    @classmethod
+    def setUpClass(cls):
+        """Setup once for all test cases (sensor discovery is expensive)"""
+        cls.monitor = xlnpwmon.PowerMonitor()
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Cleanup after all test cases"""
+        del cls.monitor
         
-    def tearDown(self):
-        """Cleanup after each test case"""
-        if hasattr(self, 'monitor'):
-            del self.monitor
+    def setUp(self):
+        """Bring the shared monitor back to a clean state before each test case"""
+        self.monitor = type(self).monitor
+        try:
+            self.monitor.stop_sampling()
+        except RuntimeError:
+            pass
+        self.monitor.reset_statistics()
 
     def test_init(self):
         """Test PowerMonitor initialization"""
@@ -52,6 +71,56 @@ class TestJetPwMon(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.monitor.stop_sampling()
             
+    def test_wait_for_samples(self):
+        """Test waiting for samples to be collected"""
+        # Waiting without sampling should fail
+        with self.assertRaises(RuntimeError):
+            self.monitor.wait_for_samples(1, timeout=0.1)
+            
+        # Set sampling frequency and start sampling
+        self.monitor.set_sampling_frequency(100)
+        self.monitor.start_sampling()
+        
+        # Wait for some data to be collected
+        self.assertTrue(self.monitor.wait_for_samples(5, timeout=1.0))
+        stats = self.monitor.get_statistics()
+        self.assertGreaterEqual(stats['total']['power']['count'], 5)
+        
+        # Test timing out before enough samples are collected
+        self.assertFalse(self.monitor.wait_for_samples(10**6, timeout=0.2))
+        
+        # Stop sampling
+        self.monitor.stop_sampling()
+        
+        # Test invalid timeouts
+        with self.assertRaises(ValueError):
+            self.monitor.wait_for_samples(1, timeout=-1.0)
+        with self.assertRaises(ValueError):
+            self.monitor.wait_for_samples(1, timeout=float('nan'))
+            
+    def test_wait_for_samples_wakes_on_stop(self):
+        """Test that a waiting thread wakes up when sampling stops"""
+        # Set sampling frequency and start sampling
+        self.monitor.set_sampling_frequency(10)
+        self.monitor.start_sampling()
+        
+        # Wait without a deadline in a background thread
+        errors = []
+        def waiter():
+            try:
+                self.monitor.wait_for_samples(10**6, timeout=float('inf'))
+            except RuntimeError as e:
+                errors.append(e)
+        thread = threading.Thread(target=waiter, daemon=True)
+        thread.start()
+        time.sleep(0.2)
+        
+        # Stopping sampling should release the waiter with an error
+        self.monitor.stop_sampling()
+        thread.join(timeout=2.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        
     def test_data_collection(self):
         """Test power data collection"""
         # Set sampling frequency and start sampling
@@ -59,7 +128,7 @@ class TestJetPwMon(unittest.TestCase):
         self.monitor.start_sampling()
         
         # Wait for some data to be collected
-        time.sleep(0.5)
+        self.assertTrue(self.monitor.wait_for_samples(5, timeout=1.0))
         
         # Get latest data
         data = self.monitor.get_latest_data()
@@ -104,7 +173,7 @@ class TestJetPwMon(unittest.TestCase):
         self.monitor.start_sampling()
         
         # Wait for some data to be collected
-        time.sleep(0.5)
+        self.assertTrue(self.monitor.wait_for_samples(5, timeout=1.0))
         
         # Get statistics
         stats = self.monitor.get_statistics()
@@ -118,11 +187,7 @@ class TestJetPwMon(unittest.TestCase):
         for key in ['voltage', 'current', 'power']:
             self.assertIn(key, total)
             stat_data = total[key]
-            self.assertIn('min', stat_data)
-            self.assertIn('max', stat_data)
-            self.assertIn('avg', stat_data)
-            self.assertIn('total', stat_data)
-            self.assertIn('count', stat_data)
+            self.assertEqual(STAT_KEYS & stat_data.keys(), STAT_KEYS)
             
         # Check sensor statistics
         sensors = stats['sensors']
@@ -133,15 +198,69 @@ class TestJetPwMon(unittest.TestCase):
             for key in ['voltage', 'current', 'power']:
                 self.assertIn(key, sensor)
                 stat_data = sensor[key]
-                self.assertIn('min', stat_data)
-                self.assertIn('max', stat_data)
-                self.assertIn('avg', stat_data)
-                self.assertIn('total', stat_data)
-                self.assertIn('count', stat_data)
+                self.assertEqual(STAT_KEYS & stat_data.keys(), STAT_KEYS)
                 
         # Stop sampling
         self.monitor.stop_sampling()
         
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_latest_data_array(self):
+        """Test latest power data as a NumPy structured array"""
+        # Set sampling frequency and start sampling
+        self.monitor.set_sampling_frequency(10)
+        self.monitor.start_sampling()
+        
+        # Wait for some data to be collected
+        self.assertTrue(self.monitor.wait_for_samples(5, timeout=1.0))
+        
+        # Stop sampling so both snapshots see the same data
+        self.monitor.stop_sampling()
+        
+        # Get latest data
+        data_arr = self.monitor.get_latest_data_array()
+        data = self.monitor.get_latest_data()
+        self.assertIsInstance(data_arr, np.ndarray)
+        self.assertEqual(len(data_arr), data['sensor_count'])
+        for key in ['name', 'type', 'voltage', 'current', 'power', 'online', 'status',
+                    'warning_threshold', 'critical_threshold']:
+            self.assertIn(key, data_arr.dtype.names)
+            
+        # Check values against the dictionary API
+        for record, sensor in zip(data_arr, data['sensors']):
+            self.assertEqual(record['name'].decode(), sensor['name'])
+            for field in ['power', 'voltage', 'current', 'online']:
+                self.assertEqual(record[field], sensor[field])
+            # type is an enum in the dict API and an unsigned integer in the array
+            self.assertEqual(xlnpwmon.SensorType(int(record['type'])), sensor['type'])
+        
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_statistics_array(self):
+        """Test power statistics as a NumPy structured array"""
+        # Set sampling frequency and start sampling
+        self.monitor.set_sampling_frequency(10)
+        self.monitor.start_sampling()
+        
+        # Wait for some data to be collected
+        self.assertTrue(self.monitor.wait_for_samples(5, timeout=1.0))
+        
+        # Stop sampling so both snapshots see the same data
+        self.monitor.stop_sampling()
+        
+        # Get statistics
+        stats_arr = self.monitor.get_statistics_array()
+        stats = self.monitor.get_statistics()
+        self.assertIsInstance(stats_arr, np.ndarray)
+        self.assertEqual(len(stats_arr), stats['sensor_count'])
+        self.assertEqual(set(stats_arr.dtype.names), {'name', 'voltage', 'current', 'power'})
+        for key in ['voltage', 'current', 'power']:
+            self.assertEqual(set(stats_arr.dtype[key].names), STAT_KEYS)
+            
+        # Check values against the dictionary API
+        for record, sensor in zip(stats_arr, stats['sensors']):
+            self.assertEqual(record['name'].decode(), sensor['name'])
+            for field in ['count', 'avg', 'min', 'max']:
+                self.assertEqual(record['power'][field], sensor['power'][field])
+        
     def test_sensor_info(self):
         """Test sensor information retrieval"""
         # Get sensor count
@@ -172,6 +291,23 @@ class TestJetPwMon(unittest.TestCase):
                 self.assertIsInstance(sensor['name'], str)
                 self.assertGreater(len(sensor['name']), 0)
             
+    def test_sensor_count_cache(self):
+        """Test that the sensor count is queried once and re-queried after reset"""
+        core_cls = xlnpwmon._core.PowerMonitor
+        counting = mock.Mock(side_effect=core_cls.get_sensor_count)
+        # Wrap in a plain function so it binds to the instance like a method
+        with mock.patch.object(core_cls, 'get_sensor_count',
+                               lambda monitor: counting(monitor)):
+            self.monitor.reset_statistics()
+            count = self.monitor.get_sensor_count()
+            self.assertEqual(self.monitor.get_sensor_count(), count)
+            self.assertEqual(counting.call_count, 1)
+            
+            # Resetting drops the cached count
+            self.monitor.reset_statistics()
+            self.assertEqual(self.monitor.get_sensor_count(), count)
+            self.assertEqual(counting.call_count, 2)
+            
     def test_error_handling(self):
         """Test error handling functionality"""
         # Test error codes
@@ -104,6 +104,46 @@ TEST_F(JetPwMonCAPITest, SamplingControl) {
     EXPECT_EQ(PM_ERROR_NOT_RUNNING, err) << "Stopping sampling again did not return expected error.";
 }
 
+// Test case: Waiting for samples to be collected
+TEST_F(JetPwMonCAPITest, WaitForSamples) {
+    pm_error_t err;
+    bool reached = false;
+
+    // --- Invalid output pointer ---
+    err = pm_wait_for_samples(handle_, 1, 100, nullptr);
+    EXPECT_EQ(PM_ERROR_INIT_FAILED, err) << "Null reached pointer did not return expected error.";
+
+    // --- Waiting without sampling (expect error) ---
+    err = pm_wait_for_samples(handle_, 1, 100, &reached);
+    EXPECT_EQ(PM_ERROR_NOT_RUNNING, err) << "Waiting without sampling did not return expected error.";
+    EXPECT_FALSE(reached);
+
+    ASSERT_EQ(PM_SUCCESS, pm_set_sampling_frequency(handle_, 100));
+    ASSERT_EQ(PM_SUCCESS, pm_start_sampling(handle_));
+
+    // --- Wait for a few samples ---
+    err = pm_wait_for_samples(handle_, 5, 2000, &reached);
+    EXPECT_EQ(PM_SUCCESS, err) << "Failed to wait for samples: " << pm_error_string(err);
+    EXPECT_TRUE(reached) << "Samples were not collected before the timeout.";
+
+    // --- Timing out is not an error ---
+    err = pm_wait_for_samples(handle_, UINT64_MAX, 100, &reached);
+    EXPECT_EQ(PM_SUCCESS, err) << "Timing out returned an error: " << pm_error_string(err);
+    EXPECT_FALSE(reached) << "reached was set although the wait timed out.";
+
+    // --- Stopping sampling wakes up a waiter without a deadline ---
+    pm_error_t wait_err = PM_SUCCESS;
+    bool wait_reached = true;
+    std::thread waiter([&]() {
+        wait_err = pm_wait_for_samples(handle_, UINT64_MAX, -1, &wait_reached);
+    });
+    SleepForSampling(100);
+    ASSERT_EQ(PM_SUCCESS, pm_stop_sampling(handle_));
+    waiter.join();
+    EXPECT_EQ(PM_ERROR_NOT_RUNNING, wait_err) << "Waiter did not observe sampling stop.";
+    EXPECT_FALSE(wait_reached);
+}
+
 // Test case: Getting the latest instantaneous data
 TEST_F(JetPwMonCAPITest, DataCollection) {
     pm_error_t err;
@@ -146,6 +186,45 @@ TEST_F(JetPwMonCAPITest, DataCollection) {
     }
 }
 
+// Test case: Copying the latest data into a caller-provided array
+TEST_F(JetPwMonCAPITest, CopyLatestData) {
+    pm_error_t err;
+    int sensor_count = 0;
+
+    ASSERT_EQ(PM_SUCCESS, pm_get_sensor_count(handle_, &sensor_count));
+    ASSERT_GT(sensor_count, 0);
+
+    // Collect some samples, then stop so the internal data is stable
+    ASSERT_EQ(PM_SUCCESS, pm_set_sampling_frequency(handle_, 100));
+    ASSERT_EQ(PM_SUCCESS, pm_start_sampling(handle_));
+    bool reached = false;
+    ASSERT_EQ(PM_SUCCESS, pm_wait_for_samples(handle_, 5, 2000, &reached));
+    ASSERT_EQ(PM_SUCCESS, pm_stop_sampling(handle_));
+
+    // --- Invalid arguments ---
+    int count = sensor_count;
+    EXPECT_EQ(PM_ERROR_INIT_FAILED, pm_copy_latest_data(handle_, nullptr, &count));
+
+    std::vector<pm_sensor_data_t> copy(sensor_count);
+    count = -1;
+    EXPECT_EQ(PM_ERROR_INIT_FAILED, pm_copy_latest_data(handle_, copy.data(), &count));
+    EXPECT_EQ(-1, count) << "count was modified for an invalid size.";
+
+    // --- Full copy matches pm_get_latest_data ---
+    count = sensor_count;
+    err = pm_copy_latest_data(handle_, copy.data(), &count);
+    ASSERT_EQ(PM_SUCCESS, err) << "Failed to copy latest data: " << pm_error_string(err);
+    ASSERT_EQ(sensor_count, count);
+
+    pm_power_data_t data;
+    ASSERT_EQ(PM_SUCCESS, pm_get_latest_data(handle_, &data));
+    for (int i = 0; i < count; i++) {
+        EXPECT_STREQ(data.sensors[i].name, copy[i].name);
+        EXPECT_EQ(data.sensors[i].type, copy[i].type);
+        EXPECT_DOUBLE_EQ(data.sensors[i].power, copy[i].power);
+    }
+}
+
 // Test case: Collecting and checking statistics
 TEST_F(JetPwMonCAPITest, StatisticsCollection) {
     pm_error_t err;
@@ -201,6 +280,52 @@ TEST_F(JetPwMonCAPITest, StatisticsCollection) {
     }
 }
 
+// Test case: Copying statistics into a caller-provided array
+TEST_F(JetPwMonCAPITest, CopyStatistics) {
+    pm_error_t err;
+    int sensor_count = 0;
+
+    ASSERT_EQ(PM_SUCCESS, pm_get_sensor_count(handle_, &sensor_count));
+    ASSERT_GT(sensor_count, 0);
+
+    // Collect some samples, then stop so the internal statistics are stable
+    ASSERT_EQ(PM_SUCCESS, pm_reset_statistics(handle_));
+    ASSERT_EQ(PM_SUCCESS, pm_set_sampling_frequency(handle_, 100));
+    ASSERT_EQ(PM_SUCCESS, pm_start_sampling(handle_));
+    bool reached = false;
+    ASSERT_EQ(PM_SUCCESS, pm_wait_for_samples(handle_, 5, 2000, &reached));
+    ASSERT_EQ(PM_SUCCESS, pm_stop_sampling(handle_));
+
+    // --- Invalid arguments ---
+    int count = sensor_count;
+    EXPECT_EQ(PM_ERROR_INIT_FAILED, pm_copy_statistics(handle_, nullptr, &count));
+
+    std::vector<pm_sensor_stats_t> copy(sensor_count);
+    count = -1;
+    EXPECT_EQ(PM_ERROR_INIT_FAILED, pm_copy_statistics(handle_, copy.data(), &count));
+    EXPECT_EQ(-1, count) << "count was modified for an invalid size.";
+
+    // --- Full copy matches pm_get_statistics ---
+    count = sensor_count;
+    err = pm_copy_statistics(handle_, copy.data(), &count);
+    ASSERT_EQ(PM_SUCCESS, err) << "Failed to copy statistics: " << pm_error_string(err);
+    ASSERT_EQ(sensor_count, count);
+
+    pm_power_stats_t stats;
+    ASSERT_EQ(PM_SUCCESS, pm_get_statistics(handle_, &stats));
+    for (int i = 0; i < count; i++) {
+        EXPECT_STREQ(stats.sensors[i].name, copy[i].name);
+        EXPECT_EQ(stats.sensors[i].power.count, copy[i].power.count);
+        EXPECT_DOUBLE_EQ(stats.sensors[i].power.avg, copy[i].power.avg);
+    }
+
+    // --- A smaller array is filled up to its size ---
+    count = 1;
+    err = pm_copy_statistics(handle_, copy.data(), &count);
+    EXPECT_EQ(PM_SUCCESS, err);
+    EXPECT_EQ(1, count);
+}
+
 // Test case: Sensor information retrieval (count)
 TEST_F(JetPwMonCAPITest, SensorInfo) {
     pm_error_t err;